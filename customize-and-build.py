@@ -24,7 +24,10 @@ import json
 import shutil
 import subprocess
 import argparse
-import re
+import mmap
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -35,34 +38,173 @@ except ImportError:
     print("Error: PyYAML is required. Install it with: pip install pyyaml")
     sys.exit(1)
 
+try:
+    # libyaml-backed C parser/emitter, 5-10x faster than the pure-Python one
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
+try:
+    # API-compatible drop-in with better backtracking behaviour on the
+    # whitespace-heavy patterns below; stdlib re is a fine fallback
+    import regex as re
+except ImportError:
+    import re
+
+
+# Precompiled patterns for SettingsPage.tsx
+_RE_DATA_IMPORT = re.compile(r"import DataSettings from '\./DataSettings/DataSettings'\n")
+_RE_HARDDRIVE = re.compile(r',\s*\n\s*HardDrive')
+_RE_DATA_MENU = re.compile(
+    r'<MenuItemLink to="/settings/data">\s*\n\s*<MenuItem className=\{isRoute\(\'/settings/data\'\)\}>\s*\n\s*<HardDrive size=\{18\} />\s*\n\s*\{t\(\'settings\.data\.title\'\)\}\s*\n\s*</MenuItem>\s*\n\s*</MenuItemLink>\s*\n',
+    re.MULTILINE
+)
+_RE_DATA_ROUTE = re.compile(r'<Route path="data" element=\{<DataSettings />\} />\s*\n')
+
+# Precompiled patterns for BailianStrategy.ts
+_RE_BUILDURL = re.compile(
+    r"buildUrl\(\): string \{\s*\n\s*return 'https://dashscope\.aliyuncs\.com/api/v1/services/rerank/text-rerank/text-rerank'\s*\n\s*\}"
+)
+
+# Precompiled patterns for update UI hiding
+_RE_UPDATE_BUTTON = re.compile(r'(const UpdateAppButton: FC = \(\) => \{)')
+_RE_ANTD_IMPORT = re.compile(r"import \{([^}]+)\} from 'antd'")
+_RE_ANTD_UNUSED = re.compile(r',?\s*\b(Radio|Switch|Tooltip)\b')
+_RE_AUTO_UPDATE_TRUE = re.compile(r'autoCheckUpdate: true,')
+
+# Targeted package.json field edits that keep formatting and key order
+_RE_PKG_NAME = re.compile(r'("name":\s*)"[^"]*"')
+_RE_PKG_PRODUCT_NAME = re.compile(r'("productName":\s*)"[^"]*"')
+_RE_PKG_VERSION = re.compile(r'("version":\s*)"[^"]*"')
+
+# AboutSettings.tsx: CheckUpdateButton block (inside AboutHeader, guarded by !isPortable)
+_ABOUT_CHECK_BTN = """          {!isPortable && (
+            <CheckUpdateButton
+              onClick={onCheckUpdate}
+              loading={update.checking}
+              disabled={update.downloading || update.checking}>
+              {update.downloading
+                ? t('settings.about.downloading')
+                : update.available
+                  ? t('settings.about.checkUpdate.available')
+                  : t('settings.about.checkUpdate.label')}
+            </CheckUpdateButton>
+          )}"""
+
+# AboutSettings.tsx: auto-update + test-plan block (second !isPortable guard after AboutHeader)
+_ABOUT_UPDATE_BLOCK = """        {!isPortable && (
+          <>
+            <SettingDivider />
+            <SettingRow>
+              <SettingRowTitle>{t('settings.general.auto_check_update.title')}</SettingRowTitle>
+              <Switch value={autoCheckUpdate} onChange={(v) => setAutoCheckUpdate(v)} />
+            </SettingRow>
+            <SettingDivider />
+            <SettingRow>
+              <SettingRowTitle>{t('settings.general.test_plan.title')}</SettingRowTitle>
+              <Tooltip title={t('settings.general.test_plan.tooltip')} trigger={['hover', 'focus']}>
+                <Switch value={testPlan} onChange={(v) => handleSetTestPlan(v)} />
+              </Tooltip>
+            </SettingRow>
+            {testPlan && (
+              <>
+                <SettingDivider />
+                <SettingRow>
+                  <SettingRowTitle>{t('settings.general.test_plan.version_options')}</SettingRowTitle>
+                  <Radio.Group
+                    size="small"
+                    buttonStyle="solid"
+                    value={getTestChannel()}
+                    onChange={(e) => handleTestChannelChange(e.target.value)}>
+                    {getAvailableTestChannels().map((option) => (
+                      <Tooltip key={option.value} title={option.tooltip}>
+                        <Radio.Button value={option.value}>{option.label}</Radio.Button>
+                      </Tooltip>
+                    ))}
+                  </Radio.Group>
+                </SettingRow>
+              </>
+            )}
+          </>
+        )}"""
+
+# Remaining literal removals/rewrites for AboutSettings.tsx, applied in one
+# pass via a single compiled alternation instead of sequential str.replace
+# scans; the two multi-KB blocks above are spliced out with _remove_once
+# so they don't bloat the alternation
+_ABOUT_REPLACEMENTS = {
+    # Unused state and functions
+    "  const [isPortable, setIsPortable] = useState(false)\n": '',
+    "  const { autoCheckUpdate, setAutoCheckUpdate, testPlan, setTestPlan, testChannel, setTestChannel } = useSettings()\n":
+        "  const { autoCheckUpdate, setAutoCheckUpdate } = useSettings()\n",
+    "\n  const onCheckUpdate = debounce(\n    async () => {\n      if (update.checking || update.downloading) {\n        return\n      }\n\n      if (update.downloaded) {\n        // Open update dialog directly in renderer\n        UpdateDialogPopup.show({ releaseInfo: update.info || null })\n        return\n      }\n\n      dispatch(setUpdateState({ checking: true }))\n\n      try {\n        await window.api.checkForUpdate()\n      } catch (error) {\n        window.toast.error(t('settings.about.updateError'))\n      }\n\n      dispatch(setUpdateState({ checking: false }))\n    },\n    2000,\n    { leading: true, trailing: false }\n  )\n":
+        '\n',
+    "\n  const currentChannelByVersion =\n    [\n      { pattern: `-${UpgradeChannel.BETA}.`, channel: UpgradeChannel.BETA },\n      { pattern: `-${UpgradeChannel.RC}.`, channel: UpgradeChannel.RC }\n    ].find(({ pattern }) => version.includes(pattern))?.channel || UpgradeChannel.LATEST\n\n  const handleTestChannelChange = async (value: UpgradeChannel) => {\n    if (testPlan && currentChannelByVersion !== UpgradeChannel.LATEST && value !== currentChannelByVersion) {\n      window.toast.warning(t('settings.general.test_plan.version_channel_not_match'))\n    }\n    setTestChannel(value)\n    // Clear update info when switching upgrade channel\n    dispatch(\n      setUpdateState({\n        available: false,\n        info: null,\n        downloaded: false,\n        checking: false,\n        downloading: false,\n        downloadProgress: 0\n      })\n    )\n  }\n\n  // Get available test version options based on current version\n  const getAvailableTestChannels = () => {\n    return [\n      {\n        tooltip: t('settings.general.test_plan.rc_version_tooltip'),\n        label: t('settings.general.test_plan.rc_version'),\n        value: UpgradeChannel.RC\n      },\n      {\n        tooltip: t('settings.general.test_plan.beta_version_tooltip'),\n        label: t('settings.general.test_plan.beta_version'),\n        value: UpgradeChannel.BETA\n      }\n    ]\n  }\n\n  const handleSetTestPlan = (value: boolean) => {\n    setTestPlan(value)\n    dispatch(\n      setUpdateState({\n        available: false,\n        info: null,\n        downloaded: false,\n        checking: false,\n        downloading: false,\n        downloadProgress: 0\n      })\n    )\n\n    if (value === true) {\n      setTestChannel(getTestChannel())\n    }\n  }\n\n  const getTestChannel = () => {\n    if (testChannel === UpgradeChannel.LATEST) {\n      return UpgradeChannel.RC\n    }\n    return testChannel\n  }\n":
+        '\n',
+    # Fix useEffect: remove setIsPortable call
+    "      setVersion(appInfo.version)\n      setIsPortable(appInfo.isPortable)\n":
+        "      setVersion(appInfo.version)\n",
+    # Remove CheckUpdateButton styled component
+    "\nconst CheckUpdateButton = styled(Button)``\n": '\n',
+    # Remove unused dispatch
+    "  const dispatch = useAppDispatch()\n": '',
+    # Remove unused imports
+    "import UpdateDialogPopup from '@renderer/components/Popups/UpdateDialogPopup'\n": '',
+    "import { useAppDispatch } from '@renderer/store'\n": '',
+    "import { setUpdateState } from '@renderer/store/runtime'\n": '',
+    "import { UpgradeChannel } from '@shared/config/constant'\n": '',
+    "import { debounce } from 'lodash'\n": '',
+}
+# Longest-first alternation so overlapping literals resolve to the longer match
+_ABOUT_RE = re.compile('|'.join(re.escape(k) for k in sorted(_ABOUT_REPLACEMENTS, key=len, reverse=True)))
+
+
+def _remove_once(s: str, literal: str) -> str:
+    """Remove the first occurrence of literal via find + two slices.
+
+    Returns s itself (same object) when the literal is absent, so callers
+    can detect a removal with an identity check.
+    """
+    i = s.find(literal)
+    if i < 0:
+        return s
+    return s[:i] + s[i + len(literal):]
+
 
 class Logger:
     """Logger for recording all operations"""
 
     def __init__(self, log_file: str = "customize-build.log"):
         self.log_file = log_file
-        self.log_handle = open(log_file, 'a', encoding='utf-8')
+        # Large write buffer; INFO lines are flushed lazily, only
+        # warnings/errors and close() force the buffer out
+        self.log_handle = open(log_file, 'a', buffering=1 << 16, encoding='utf-8')
+        # Modifiers may log from worker threads
+        self._lock = threading.Lock()
 
-    def log(self, level: str, message: str):
+    def log(self, level: str, message: str, flush: bool = False):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_message = f"[{timestamp}] [{level}] {message}"
-        print(log_message)
-        self.log_handle.write(log_message + "\n")
-        self.log_handle.flush()
+        with self._lock:
+            print(log_message)
+            self.log_handle.write(log_message + "\n")
+            if flush:
+                self.log_handle.flush()
 
     def info(self, message: str):
         self.log(level="INFO", message=message)
 
     def warning(self, message: str):
-        self.log(level="WARN", message=message)
+        self.log(level="WARN", message=message, flush=True)
 
     def error(self, message: str):
-        self.log(level="ERROR", message=message)
+        self.log(level="ERROR", message=message, flush=True)
 
     def success(self, message: str):
         self.log(level="SUCCESS", message=message)
 
     def close(self):
+        self.log_handle.flush()
         self.log_handle.close()
 
 
@@ -77,13 +219,14 @@ class ConfigManager:
     def load(self) -> bool:
         """Load and validate configuration"""
         try:
-            if not os.path.exists(self.config_path):
+            # EAFP: one open() instead of an exists() stat plus an open()
+            try:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    self.config = json.load(f)
+            except FileNotFoundError:
                 self.logger.error(f"Config file not found: {self.config_path}")
                 return False
 
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
-
             # Validate required fields
             required_fields = ['appId', 'productName', 'packageName', 'version']
             for field in required_fields:
@@ -123,12 +266,36 @@ class BackupManager:
     def backup_file(self, file_path: str) -> bool:
         """Backup a file"""
         try:
-            if not os.path.exists(file_path):
+            # EAFP: stat the files directly instead of exists() + stat()
+            try:
+                source_mtime = os.stat(file_path).st_mtime_ns
+            except FileNotFoundError:
                 self.logger.warning(f"File not found, skipping backup: {file_path}")
                 return False
 
             backup_path = os.path.join(self.backup_dir, os.path.basename(file_path) + '.bak')
-            shutil.copy2(file_path, backup_path)
+
+            # Re-runs: skip the copy when the backup is at least as new as
+            # the source (copystat preserved the mtime, so equal means
+            # unchanged); an older backup is the pristine copy from the
+            # first run and must never be overwritten with a modified file
+            try:
+                backup_mtime = os.stat(backup_path).st_mtime_ns
+            except FileNotFoundError:
+                backup_mtime = None
+
+            if backup_mtime is not None:
+                self.backed_up_files.append(file_path)
+                if backup_mtime >= source_mtime:
+                    self.logger.info(f"Backup up to date, skipping: {backup_path}")
+                else:
+                    self.logger.info(f"Backup already exists, keeping pristine copy: {backup_path}")
+                return True
+
+            # copyfile uses the kernel-side fast copy path (sendfile);
+            # copystat preserves the metadata copy2 would have kept
+            shutil.copyfile(file_path, backup_path)
+            shutil.copystat(file_path, backup_path)
             self.backed_up_files.append(file_path)
             self.logger.info(f"Backed up: {file_path} -> {backup_path}")
             return True
@@ -143,7 +310,8 @@ class BackupManager:
             for file_path in self.backed_up_files:
                 backup_path = os.path.join(self.backup_dir, os.path.basename(file_path) + '.bak')
                 if os.path.exists(backup_path):
-                    shutil.copy2(backup_path, file_path)
+                    shutil.copyfile(backup_path, file_path)
+                    shutil.copystat(backup_path, file_path)
                     self.logger.info(f"Restored: {backup_path} -> {file_path}")
             return True
         except Exception as e:
@@ -157,45 +325,51 @@ class FileModifier:
     def __init__(self, logger: Logger, dry_run: bool = False):
         self.logger = logger
         self.dry_run = dry_run
+        # Content cache keyed by (path, mtime_ns) so unchanged files are
+        # read at most once across modifiers and re-runs
+        self._file_cache: Dict[tuple, str] = {}
+
+    def _read_text(self, file_path: str) -> str:
+        """Read a file through the (path, mtime) content cache"""
+        key = (file_path, os.stat(file_path).st_mtime_ns)
+        content = self._file_cache.get(key)
+        if content is None:
+            content = Path(file_path).read_text(encoding='utf-8')
+            self._file_cache[key] = content
+        return content
 
     def modify_settings_page(self, file_path: str) -> bool:
         """Remove DataSettings module from SettingsPage.tsx"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_text(file_path)
 
-            original_content = content
+            # Track change via substitution counts instead of keeping a
+            # second full copy of the file for comparison
+            changed = False
 
+            # Cheap substring checks gate each regex so already-modified
+            # files (the common re-run case) skip the regex engine entirely
             # Remove DataSettings import
-            content = re.sub(
-                r"import DataSettings from '\./DataSettings/DataSettings'\n",
-                '',
-                content
-            )
+            if "import DataSettings from './DataSettings/DataSettings'" in content:
+                content, n = _RE_DATA_IMPORT.subn('', content)
+                changed = changed or n > 0
 
             # Remove HardDrive from icon imports
-            content = re.sub(
-                r',\s*\n\s*HardDrive',
-                '',
-                content
-            )
+            if 'HardDrive' in content:
+                content, n = _RE_HARDDRIVE.subn('', content)
+                changed = changed or n > 0
 
             # Remove data settings menu item
-            content = re.sub(
-                r'<MenuItemLink to="/settings/data">\s*\n\s*<MenuItem className=\{isRoute\(\'/settings/data\'\)\}>\s*\n\s*<HardDrive size=\{18\} />\s*\n\s*\{t\(\'settings\.data\.title\'\)\}\s*\n\s*</MenuItem>\s*\n\s*</MenuItemLink>\s*\n',
-                '',
-                content,
-                flags=re.MULTILINE
-            )
+            if '<MenuItemLink to="/settings/data">' in content:
+                content, n = _RE_DATA_MENU.subn('', content)
+                changed = changed or n > 0
 
             # Remove data settings route
-            content = re.sub(
-                r'<Route path="data" element=\{<DataSettings />\} />\s*\n',
-                '',
-                content
-            )
+            if '<Route path="data"' in content:
+                content, n = _RE_DATA_ROUTE.subn('', content)
+                changed = changed or n > 0
 
-            if content == original_content:
+            if not changed:
                 # Check if already modified
                 if 'DataSettings' not in content:
                     self.logger.info("SettingsPage.tsx already has DataSettings removed - skipping")
@@ -204,8 +378,7 @@ class FileModifier:
                 return False
 
             if not self.dry_run:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                Path(file_path).write_text(content, encoding='utf-8')
                 self.logger.success(f"Modified: {file_path}")
             else:
                 self.logger.info(f"[DRY RUN] Would modify: {file_path}")
@@ -219,8 +392,7 @@ class FileModifier:
     def modify_bailian_strategy(self, file_path: str) -> bool:
         """Add baseURL parameter to BailianStrategy.ts"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_text(file_path)
 
             # Check if already modified
             if 'buildUrl(baseURL?: string)' in content:
@@ -228,8 +400,6 @@ class FileModifier:
                 return True
 
             # Replace buildUrl method
-            old_method = r"buildUrl\(\): string \{\s*\n\s*return 'https://dashscope\.aliyuncs\.com/api/v1/services/rerank/text-rerank/text-rerank'\s*\n\s*\}"
-
             new_method = """buildUrl(baseURL?: string): string {
     // 如果提供了自定义 baseURL，使用自定义地址
     if (baseURL) {
@@ -240,15 +410,19 @@ class FileModifier:
     return 'https://dashscope.aliyuncs.com/api/v1/services/rerank/text-rerank/text-rerank'
   }"""
 
-            if not re.search(old_method, content):
+            # Fast fail before running the regex at all
+            if "return 'https://dashscope.aliyuncs.com" not in content:
                 self.logger.warning("BailianStrategy.ts buildUrl method pattern not found - file may have unexpected format")
                 return False
 
-            content = re.sub(old_method, new_method, content)
+            if not _RE_BUILDURL.search(content):
+                self.logger.warning("BailianStrategy.ts buildUrl method pattern not found - file may have unexpected format")
+                return False
+
+            content = _RE_BUILDURL.sub(new_method, content)
 
             if not self.dry_run:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                Path(file_path).write_text(content, encoding='utf-8')
                 self.logger.success(f"Modified: {file_path}")
             else:
                 self.logger.info(f"[DRY RUN] Would modify: {file_path}")
@@ -262,15 +436,16 @@ class FileModifier:
     def modify_electron_builder_yml(self, file_path: str, app_id: str, product_name: str) -> bool:
         """Modify electron-builder.yml"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config = yaml.load(self._read_text(file_path), Loader=_YamlLoader)
 
             config['appId'] = app_id
             config['productName'] = product_name
 
             if not self.dry_run:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+                Path(file_path).write_text(
+                    yaml.dump(config, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True),
+                    encoding='utf-8'
+                )
                 self.logger.success(f"Modified: {file_path}")
             else:
                 self.logger.info(f"[DRY RUN] Would modify: {file_path}")
@@ -283,202 +458,134 @@ class FileModifier:
 
     def hide_update_ui(self) -> bool:
         """Hide update-related UI elements"""
-        success = True
+        # Stop at the first failure - the caller restores every backup
+        # anyway, so modifying the remaining files would be wasted work
+        if not self._hide_update_button():
+            return False
+        if not self._hide_about_update_rows():
+            return False
+        return self._disable_auto_check_update()
 
-        # --- UpdateAppButton.tsx: return null immediately ---
+    def _hide_update_button(self) -> bool:
+        """UpdateAppButton.tsx: return null immediately"""
         btn_path = 'src/renderer/src/pages/home/components/UpdateAppButton.tsx'
         try:
-            with open(btn_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_text(btn_path)
             if 'return null // customized: hidden' in content:
                 self.logger.info("UpdateAppButton.tsx already hidden - skipping")
             else:
-                content = re.sub(
-                    r'(const UpdateAppButton: FC = \(\) => \{)',
+                content, n = _RE_UPDATE_BUTTON.subn(
                     r'\1\n  return null // customized: hidden',
                     content
                 )
-                if not self.dry_run:
-                    with open(btn_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
+                if n == 0:
+                    self.logger.warning("UpdateAppButton.tsx component pattern not found - skipping write")
+                elif not self.dry_run:
+                    Path(btn_path).write_text(content, encoding='utf-8')
                     self.logger.success(f"Modified: {btn_path}")
                 else:
                     self.logger.info(f"[DRY RUN] Would modify: {btn_path}")
+            return True
         except Exception as e:
             self.logger.error(f"Failed to modify {btn_path}: {e}")
-            success = False
+            return False
 
-        # --- AboutSettings.tsx: remove CheckUpdateButton and auto-update/test-plan rows ---
+    def _hide_about_update_rows(self) -> bool:
+        """AboutSettings.tsx: remove CheckUpdateButton and auto-update/test-plan rows"""
         about_path = 'src/renderer/src/pages/settings/AboutSettings.tsx'
         try:
-            with open(about_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            if '// customized: update ui hidden' in content:
+            # Constant-memory sentinel scan via mmap before pulling the
+            # whole (potentially hundreds of KB) file into memory
+            with open(about_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                already_hidden = mm.find(b'// customized: update ui hidden') >= 0
+            if already_hidden:
                 self.logger.info("AboutSettings.tsx already hidden - skipping")
             else:
-                # Remove CheckUpdateButton block (inside AboutHeader, guarded by !isPortable)
-                old_check_btn = """          {!isPortable && (
-            <CheckUpdateButton
-              onClick={onCheckUpdate}
-              loading={update.checking}
-              disabled={update.downloading || update.checking}>
-              {update.downloading
-                ? t('settings.about.downloading')
-                : update.available
-                  ? t('settings.about.checkUpdate.available')
-                  : t('settings.about.checkUpdate.label')}
-            </CheckUpdateButton>
-          )}"""
-                content = content.replace(old_check_btn, '')
-
-                # Remove auto-update + test-plan block (second !isPortable guard after AboutHeader)
-                old_update_block = """        {!isPortable && (
-          <>
-            <SettingDivider />
-            <SettingRow>
-              <SettingRowTitle>{t('settings.general.auto_check_update.title')}</SettingRowTitle>
-              <Switch value={autoCheckUpdate} onChange={(v) => setAutoCheckUpdate(v)} />
-            </SettingRow>
-            <SettingDivider />
-            <SettingRow>
-              <SettingRowTitle>{t('settings.general.test_plan.title')}</SettingRowTitle>
-              <Tooltip title={t('settings.general.test_plan.tooltip')} trigger={['hover', 'focus']}>
-                <Switch value={testPlan} onChange={(v) => handleSetTestPlan(v)} />
-              </Tooltip>
-            </SettingRow>
-            {testPlan && (
-              <>
-                <SettingDivider />
-                <SettingRow>
-                  <SettingRowTitle>{t('settings.general.test_plan.version_options')}</SettingRowTitle>
-                  <Radio.Group
-                    size="small"
-                    buttonStyle="solid"
-                    value={getTestChannel()}
-                    onChange={(e) => handleTestChannelChange(e.target.value)}>
-                    {getAvailableTestChannels().map((option) => (
-                      <Tooltip key={option.value} title={option.tooltip}>
-                        <Radio.Button value={option.value}>{option.label}</Radio.Button>
-                      </Tooltip>
-                    ))}
-                  </Radio.Group>
-                </SettingRow>
-              </>
-            )}
-          </>
-        )}"""
-                content = content.replace(old_update_block, '')
-
-                # Remove unused state and functions
-                content = content.replace(
-                    "  const [isPortable, setIsPortable] = useState(false)\n",
-                    ''
-                )
-                content = content.replace(
-                    "  const { autoCheckUpdate, setAutoCheckUpdate, testPlan, setTestPlan, testChannel, setTestChannel } = useSettings()\n",
-                    "  const { autoCheckUpdate, setAutoCheckUpdate } = useSettings()\n"
-                )
-                content = content.replace(
-                    "\n  const onCheckUpdate = debounce(\n    async () => {\n      if (update.checking || update.downloading) {\n        return\n      }\n\n      if (update.downloaded) {\n        // Open update dialog directly in renderer\n        UpdateDialogPopup.show({ releaseInfo: update.info || null })\n        return\n      }\n\n      dispatch(setUpdateState({ checking: true }))\n\n      try {\n        await window.api.checkForUpdate()\n      } catch (error) {\n        window.toast.error(t('settings.about.updateError'))\n      }\n\n      dispatch(setUpdateState({ checking: false }))\n    },\n    2000,\n    { leading: true, trailing: false }\n  )\n",
-                    '\n'
-                )
-                content = content.replace(
-                    "\n  const currentChannelByVersion =\n    [\n      { pattern: `-${UpgradeChannel.BETA}.`, channel: UpgradeChannel.BETA },\n      { pattern: `-${UpgradeChannel.RC}.`, channel: UpgradeChannel.RC }\n    ].find(({ pattern }) => version.includes(pattern))?.channel || UpgradeChannel.LATEST\n\n  const handleTestChannelChange = async (value: UpgradeChannel) => {\n    if (testPlan && currentChannelByVersion !== UpgradeChannel.LATEST && value !== currentChannelByVersion) {\n      window.toast.warning(t('settings.general.test_plan.version_channel_not_match'))\n    }\n    setTestChannel(value)\n    // Clear update info when switching upgrade channel\n    dispatch(\n      setUpdateState({\n        available: false,\n        info: null,\n        downloaded: false,\n        checking: false,\n        downloading: false,\n        downloadProgress: 0\n      })\n    )\n  }\n\n  // Get available test version options based on current version\n  const getAvailableTestChannels = () => {\n    return [\n      {\n        tooltip: t('settings.general.test_plan.rc_version_tooltip'),\n        label: t('settings.general.test_plan.rc_version'),\n        value: UpgradeChannel.RC\n      },\n      {\n        tooltip: t('settings.general.test_plan.beta_version_tooltip'),\n        label: t('settings.general.test_plan.beta_version'),\n        value: UpgradeChannel.BETA\n      }\n    ]\n  }\n\n  const handleSetTestPlan = (value: boolean) => {\n    setTestPlan(value)\n    dispatch(\n      setUpdateState({\n        available: false,\n        info: null,\n        downloaded: false,\n        checking: false,\n        downloading: false,\n        downloadProgress: 0\n      })\n    )\n\n    if (value === true) {\n      setTestChannel(getTestChannel())\n    }\n  }\n\n  const getTestChannel = () => {\n    if (testChannel === UpgradeChannel.LATEST) {\n      return UpgradeChannel.RC\n    }\n    return testChannel\n  }\n",
-                    '\n'
-                )
-                # Fix useEffect: remove setIsPortable call
-                content = content.replace(
-                    "      setVersion(appInfo.version)\n      setIsPortable(appInfo.isPortable)\n",
-                    "      setVersion(appInfo.version)\n"
-                )
-                # Remove CheckUpdateButton styled component
-                content = content.replace(
-                    "\nconst CheckUpdateButton = styled(Button)``\n",
-                    '\n'
-                )
-                # Remove unused dispatch
-                content = content.replace(
-                    "  const dispatch = useAppDispatch()\n",
-                    ''
-                )
-                # Remove unused imports
-                content = content.replace(
-                    "import UpdateDialogPopup from '@renderer/components/Popups/UpdateDialogPopup'\n",
-                    ''
-                )
-                content = content.replace(
-                    "import { useAppDispatch } from '@renderer/store'\n",
-                    ''
-                )
-                content = content.replace(
-                    "import { setUpdateState } from '@renderer/store/runtime'\n",
-                    ''
-                )
-                content = content.replace(
-                    "import { UpgradeChannel } from '@shared/config/constant'\n",
-                    ''
-                )
-                content = re.sub(
-                    r"import \{ debounce \} from 'lodash'\n",
-                    '',
-                    content
-                )
-                # Remove Radio, Switch, Tooltip from antd imports (keep remaining)
-                content = re.sub(
-                    r"import \{([^}]+)\} from 'antd'",
-                    lambda m: "import {" + re.sub(r',?\s*\b(Radio|Switch|Tooltip)\b', '', m.group(1)) + "} from 'antd'",
-                    content
-                )
-                content += '\n// customized: update ui hidden'
-                if not self.dry_run:
-                    with open(about_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    self.logger.success(f"Modified: {about_path}")
+                content = self._read_text(about_path)
+                # Splice out the two big one-shot blocks, then apply the
+                # remaining literal removals in one pass over the file
+                n = 0
+                for block in (_ABOUT_CHECK_BTN, _ABOUT_UPDATE_BLOCK):
+                    trimmed = _remove_once(content, block)
+                    if trimmed is not content:
+                        content = trimmed
+                        n += 1
+                content, subs = _ABOUT_RE.subn(lambda m: _ABOUT_REPLACEMENTS[m.group(0)], content)
+                n += subs
+                if n == 0:
+                    # Nothing matched: don't append the sentinel to an
+                    # untouched file or it would be skipped forever
+                    self.logger.warning("AboutSettings.tsx update UI patterns not found - skipping write")
                 else:
-                    self.logger.info(f"[DRY RUN] Would modify: {about_path}")
+                    # Remove Radio, Switch, Tooltip from antd imports (keep remaining)
+                    content = _RE_ANTD_IMPORT.sub(
+                        lambda m: "import {" + _RE_ANTD_UNUSED.sub('', m.group(1)) + "} from 'antd'",
+                        content
+                    )
+                    content += '\n// customized: update ui hidden'
+                    if not self.dry_run:
+                        Path(about_path).write_text(content, encoding='utf-8')
+                        self.logger.success(f"Modified: {about_path}")
+                    else:
+                        self.logger.info(f"[DRY RUN] Would modify: {about_path}")
+            return True
         except Exception as e:
             self.logger.error(f"Failed to modify {about_path}: {e}")
-            success = False
+            return False
 
-        # --- settings.ts: set autoCheckUpdate default to false ---
+    def _disable_auto_check_update(self) -> bool:
+        """settings.ts: set autoCheckUpdate default to false"""
         store_path = 'src/renderer/src/store/settings.ts'
         try:
-            with open(store_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_text(store_path)
             if 'autoCheckUpdate: false, // customized' in content:
                 self.logger.info("settings.ts autoCheckUpdate already false - skipping")
             else:
-                content = re.sub(
-                    r'autoCheckUpdate: true,',
-                    'autoCheckUpdate: false, // customized',
-                    content
-                )
-                if not self.dry_run:
-                    with open(store_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
+                n = 0
+                if 'autoCheckUpdate: true,' in content:
+                    content, n = _RE_AUTO_UPDATE_TRUE.subn('autoCheckUpdate: false, // customized', content)
+                if n == 0:
+                    self.logger.warning("settings.ts autoCheckUpdate default not found - skipping write")
+                elif not self.dry_run:
+                    Path(store_path).write_text(content, encoding='utf-8')
                     self.logger.success(f"Modified: {store_path}")
                 else:
                     self.logger.info(f"[DRY RUN] Would modify: {store_path}")
+            return True
         except Exception as e:
             self.logger.error(f"Failed to modify {store_path}: {e}")
-            success = False
-
-        return success
+            return False
 
     def modify_package_json(self, file_path: str, package_name: str, product_name: str, version: str) -> bool:
         """Modify package.json"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            content = self._read_text(file_path)
+
+            # Targeted substitutions on the three top-level fields keep the
+            # rest of the ~500-key file byte-identical instead of
+            # re-serializing (and reformatting) the whole document
+            content = _RE_PKG_VERSION.sub(rf'\1"{version}"', content, count=1)
+            if '"productName"' in content:
+                content = _RE_PKG_PRODUCT_NAME.sub(rf'\1"{product_name}"', content, count=1)
+                content = _RE_PKG_NAME.sub(rf'\1"{package_name}"', content, count=1)
+            else:
+                # Upstream package.json has no productName; add it after name
+                content = _RE_PKG_NAME.sub(
+                    rf'\1"{package_name}",\n  "productName": "{product_name}"',
+                    content,
+                    count=1
+                )
 
-            config['name'] = package_name
-            config['productName'] = product_name
-            config['version'] = version
+            # Validate the edited document still parses with the expected values
+            parsed = json.loads(content)
+            if (parsed.get('name'), parsed.get('productName'), parsed.get('version')) != \
+                    (package_name, product_name, version):
+                self.logger.error(f"package.json edit failed validation: {file_path}")
+                return False
 
             if not self.dry_run:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(config, f, indent=2, ensure_ascii=False)
-                    f.write('\n')  # Add trailing newline
+                Path(file_path).write_text(content, encoding='utf-8')
                 self.logger.success(f"Modified: {file_path}")
             else:
                 self.logger.info(f"[DRY RUN] Would modify: {file_path}")
@@ -506,24 +613,38 @@ class BuildManager:
                 self.logger.info(f"[DRY RUN] Would run: {' '.join(command)}")
                 return True
 
-            result = subprocess.run(
-                command,
-                capture_output=True,
+            # Resolve the executable (pnpm.cmd on Windows) so no cmd.exe
+            # shell wrapper is needed; Popen then takes the posix_spawn
+            # fast path on Python >= 3.8 instead of fork+exec
+            executable = shutil.which(command[0])
+            if executable is None:
+                self.logger.error(f"Command not found: {command[0]}")
+                return False
+
+            # Stream output as it arrives, keeping only a rolling tail so
+            # multi-MB build logs never accumulate in memory
+            with subprocess.Popen(
+                [executable] + command[1:],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
                 encoding='utf-8',
                 errors='replace',
-                shell=sys.platform == 'win32'
-            )
-
-            if result.returncode == 0:
+                close_fds=True,
+                bufsize=1 << 16
+            ) as process:
+                tail = deque(maxlen=200)
+                for line in process.stdout:
+                    tail.append(line)
+                    print(line, end='')
+
+            if process.returncode == 0:
                 self.logger.success(f"{description} completed")
                 return True
             else:
                 self.logger.error(f"{description} failed")
-                if result.stdout:
-                    self.logger.error(f"Output: {result.stdout[-3000:]}")
-                if result.stderr:
-                    self.logger.error(f"Error output: {result.stderr[-3000:]}")
+                if tail:
+                    self.logger.error(f"Output (last {len(tail)} lines):\n{''.join(tail)}")
                 return False
 
         except Exception as e:
@@ -547,6 +668,87 @@ class BuildManager:
         return self.run_command(['pnpm', 'build:win'], "Building Windows package")
 
 
+def _already_customized(config_manager: ConfigManager) -> bool:
+    """Cheap sentinel scan over the target files.
+
+    Returns True when every enabled modification has already been applied
+    with the *current* config values, so re-runs can skip the whole
+    backup/modify phase. Positive sentinels read only the first and last
+    16 KiB of each file - enough to cover every sentinel; negative ones
+    must scan the whole file to prove absence.
+    """
+    window = 16 * 1024
+    # (path, sentinel, expected presence)
+    checks = []
+
+    if config_manager.get('hideDataSettings', True):
+        # The DataSettings import sits in the head of SettingsPage.tsx;
+        # once removed, the name no longer appears at all
+        checks.append(('src/renderer/src/pages/settings/SettingsPage.tsx', 'DataSettings', False))
+
+    if config_manager.get('applyBailianFix', True):
+        checks.append((
+            'src/main/knowledge/reranker/strategies/BailianStrategy.ts',
+            'buildUrl(baseURL?: string)',
+            True
+        ))
+
+    if config_manager.get('hideUpdateUI', True):
+        checks.extend([
+            (
+                'src/renderer/src/pages/home/components/UpdateAppButton.tsx',
+                'return null // customized: hidden',
+                True
+            ),
+            (
+                'src/renderer/src/pages/settings/AboutSettings.tsx',
+                '// customized: update ui hidden',
+                True
+            ),
+            (
+                'src/renderer/src/store/settings.ts',
+                'autoCheckUpdate: false, // customized',
+                True
+            ),
+        ])
+
+    # Check every config-derived value, not just appId/packageName -
+    # otherwise bumping version or productName in the config would be
+    # silently skipped on a re-run
+    product_name = config_manager.get('productName')
+    checks.extend([
+        ('electron-builder.yml', f"appId: {config_manager.get('appId')}", True),
+        ('electron-builder.yml', f"productName: {product_name}", True),
+        ('package.json', f'"name": "{config_manager.get("packageName")}"', True),
+        ('package.json', f'"productName": "{product_name}"', True),
+        ('package.json', f'"version": "{config_manager.get("version")}"', True),
+    ])
+
+    for path, sentinel, expected in checks:
+        marker = sentinel.encode('utf-8')
+        try:
+            if not expected:
+                # A windowed scan cannot prove absence; read the whole
+                # file (only the ~8 KiB SettingsPage.tsx uses this)
+                present = marker in Path(path).read_bytes()
+            else:
+                with open(path, 'rb') as f:
+                    head = f.read(window)
+                    try:
+                        f.seek(-window, os.SEEK_END)
+                    except OSError:
+                        f.seek(0)
+                    tail = f.read(window)
+                present = marker in head or marker in tail
+        except OSError:
+            return False
+
+        if present != expected:
+            return False
+
+    return True
+
+
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(
@@ -586,66 +788,74 @@ def main():
         logger.close()
         sys.exit(1)
 
-    # Define files to modify
-    files_to_modify = [
-        'src/renderer/src/pages/settings/SettingsPage.tsx',
-        'src/main/knowledge/reranker/strategies/BailianStrategy.ts',
-        'electron-builder.yml',
-        'package.json',
-        'src/renderer/src/pages/home/components/UpdateAppButton.tsx',
-        'src/renderer/src/pages/settings/AboutSettings.tsx',
-        'src/renderer/src/store/settings.ts',
-    ]
-
-    # Backup files
-    logger.info("Backing up files...")
-    for file_path in files_to_modify:
-        backup_manager.backup_file(file_path)
-
-    # Initialize file modifier
-    file_modifier = FileModifier(logger, args.dry_run)
-
-    # Modify files
-    success = True
-
-    if config_manager.get('hideDataSettings', True):
-        logger.info("Removing DataSettings module...")
-        if not file_modifier.modify_settings_page('src/renderer/src/pages/settings/SettingsPage.tsx'):
-            success = False
-
-    if config_manager.get('applyBailianFix', True):
-        logger.info("Applying BailianStrategy baseURL modification...")
-        if not file_modifier.modify_bailian_strategy('src/main/knowledge/reranker/strategies/BailianStrategy.ts'):
-            success = False
-
-    if config_manager.get('hideUpdateUI', True):
-        logger.info("Hiding update UI elements...")
-        if not file_modifier.hide_update_ui():
-            success = False
-
-    logger.info("Updating build configuration...")
-    if not file_modifier.modify_electron_builder_yml(
-        'electron-builder.yml',
-        config_manager.get('appId'),
-        config_manager.get('productName')
-    ):
-        success = False
-
-    if not file_modifier.modify_package_json(
-        'package.json',
-        config_manager.get('packageName'),
-        config_manager.get('productName'),
-        config_manager.get('version')
-    ):
-        success = False
-
-    if not success:
-        logger.error("Some modifications failed. Check the log for details.")
-        if not args.dry_run:
-            logger.info("Restoring from backup...")
-            backup_manager.restore_all()
-        logger.close()
-        sys.exit(1)
+    # Skip the entire backup/modify phase when a previous run already
+    # applied every enabled modification
+    if _already_customized(config_manager):
+        logger.info("All files already customized - skipping modification phase")
+    else:
+        # Define files to modify
+        files_to_modify = [
+            'src/renderer/src/pages/settings/SettingsPage.tsx',
+            'src/main/knowledge/reranker/strategies/BailianStrategy.ts',
+            'electron-builder.yml',
+            'package.json',
+            'src/renderer/src/pages/home/components/UpdateAppButton.tsx',
+            'src/renderer/src/pages/settings/AboutSettings.tsx',
+            'src/renderer/src/store/settings.ts',
+        ]
+
+        # Backup files
+        logger.info("Backing up files...")
+        for file_path in files_to_modify:
+            backup_manager.backup_file(file_path)
+
+        # Initialize file modifier
+        file_modifier = FileModifier(logger, args.dry_run)
+
+        # Modify files — the modifiers touch disjoint files and are I/O bound
+        # (read -> regex -> write), so run them concurrently
+        tasks = []
+
+        if config_manager.get('hideDataSettings', True):
+            logger.info("Removing DataSettings module...")
+            tasks.append(lambda: file_modifier.modify_settings_page(
+                'src/renderer/src/pages/settings/SettingsPage.tsx'
+            ))
+
+        if config_manager.get('applyBailianFix', True):
+            logger.info("Applying BailianStrategy baseURL modification...")
+            tasks.append(lambda: file_modifier.modify_bailian_strategy(
+                'src/main/knowledge/reranker/strategies/BailianStrategy.ts'
+            ))
+
+        if config_manager.get('hideUpdateUI', True):
+            logger.info("Hiding update UI elements...")
+            tasks.append(file_modifier.hide_update_ui)
+
+        logger.info("Updating build configuration...")
+        tasks.append(lambda: file_modifier.modify_electron_builder_yml(
+            'electron-builder.yml',
+            config_manager.get('appId'),
+            config_manager.get('productName')
+        ))
+        tasks.append(lambda: file_modifier.modify_package_json(
+            'package.json',
+            config_manager.get('packageName'),
+            config_manager.get('productName'),
+            config_manager.get('version')
+        ))
+
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(task) for task in tasks]
+            success = all(future.result() for future in futures)
+
+        if not success:
+            logger.error("Some modifications failed. Check the log for details.")
+            if not args.dry_run:
+                logger.info("Restoring from backup...")
+                backup_manager.restore_all()
+            logger.close()
+            sys.exit(1)
 
     # Build and package
     if config_manager.get('autoBuild', True) and not args.dry_run: